@@ -41,16 +41,56 @@ function main() {
     }
     
     Logger.log('After duplicate removal: ' + uniqueSymbols.length + ' unique symbols');
-    
+
+    var minChangePct = getMinChangePct();
+    var skippedCount = 0;
     var allRows = [];
-    
+
     // Process each unique symbol
     for (var i = 0; i < uniqueSymbols.length; i++) {
       var symbol = uniqueSymbols[i];
       Logger.log('Processing symbol: ' + symbol.code);
-      
+
       try {
-      
+
+      // Small moves rarely have a news driver worth an analysis - skip the
+      // news fetch and OpenAI calls below the threshold. Stop-limit stocks
+      // are always analyzed regardless of the measured percentage.
+      if (!symbol.isStopLimit && Math.abs(symbol.pct || 0) < minChangePct) {
+        skippedCount++;
+        Logger.log('Skipping analysis for ' + symbol.code + ' (change ' + symbol.pct + '% below threshold ' + minChangePct + '%)');
+        allRows.push({
+          code: symbol.code,
+          name: symbol.name || '',
+          open: symbol.open,
+          close: symbol.close,
+          diff: symbol.diff,
+          pct: symbol.pct,
+          summary: '変動幅が小さいため分析を省略しました。テクニカル要因や需給による価格変動と推測されます。',
+          metrics: '',
+          sources: ['https://kabutan.jp/stock/?code=' + symbol.code]
+        });
+        continue;
+      }
+
+      // Reuse a cached analysis from an earlier run of the same day (retries, re-runs)
+      var cachedAnalysis = getCachedAnalysis(symbol, dateStr);
+      if (cachedAnalysis) {
+        Logger.log('Using cached analysis for ' + symbol.code);
+        allRows.push({
+          code: symbol.code,
+          name: symbol.name || '',
+          open: symbol.open,
+          close: symbol.close,
+          diff: symbol.diff,
+          pct: symbol.pct,
+          summary: cachedAnalysis.summary,
+          metrics: cachedAnalysis.metrics || '',
+          sources: cachedAnalysis.sources || []
+        });
+        continue;
+      }
+
       // Fetch news for this symbol
       var newsArticles = fetchNews(symbol.code);
       
@@ -100,9 +140,9 @@ function main() {
           Logger.log('Generated no-news summary for ' + symbol.code + ': ' + summary.substring(0, 50) + '...');
         }
         
-        // Ensure sources are collected
+        // Ensure sources are collected (three citations at most end up in the sheet)
         if (sources.length === 0 && newsArticles.length > 0) {
-          for (var k = 0; k < newsArticles.length; k++) {
+          for (var k = 0; k < newsArticles.length && sources.length < 3; k++) {
             if (newsArticles[k].url && sources.indexOf(newsArticles[k].url) === -1) {
               sources.push(newsArticles[k].url);
             }
@@ -133,7 +173,14 @@ function main() {
       };
       
       allRows.push(row);
-      
+
+      // Cache the analysis so same-day re-runs skip news fetch and OpenAI calls
+      cacheAnalysis(symbol, dateStr, {
+        summary: summary,
+        metrics: metrics,
+        sources: sources
+      });
+
       } catch (symbolError) {
         Logger.log('Error processing symbol ' + symbol.code + ': ' + symbolError.toString());
         // Add row with error information
@@ -163,7 +210,8 @@ function main() {
     }
     
     // Log success message (Slack notification disabled)
-    Logger.log('PTS Daily Report completed successfully. Processed ' + allRows.length + ' symbols for ' + dateStr);
+    Logger.log('PTS Daily Report completed successfully. Processed ' + allRows.length + ' symbols for ' + dateStr +
+               ' (' + skippedCount + ' below ' + minChangePct + '% change threshold)');
     
     Logger.log('PTS Daily Report generation completed successfully');
     
@@ -174,6 +222,61 @@ function main() {
   }
 }
 
+/**
+ * Get the minimum change percentage that warrants an AI analysis
+ * Configurable via the MIN_CHANGE_PCT Script Property; defaults to 5.0
+ * @return {number} Threshold in percent
+ */
+function getMinChangePct() {
+  var raw = PropertiesService.getScriptProperties().getProperty('MIN_CHANGE_PCT');
+  var parsed = parseFloat(raw);
+  return isNaN(parsed) ? 5.0 : parsed;
+}
+
+/**
+ * Build the analysis cache key for a symbol
+ * Keyed on (code, change percent, report date) so a symbol re-appearing with a
+ * different move, or on another day, never reuses a stale analysis
+ * @param {Object} symbol - Stock symbol object
+ * @param {string} dateStr - Report date string (yyyy-MM-dd)
+ * @return {string} Cache key
+ */
+function buildAnalysisCacheKey(symbol, dateStr) {
+  var pct = Number(symbol.pct || 0).toFixed(2);
+  return 'analysis_' + dateStr + '_' + symbol.code + '_' + pct;
+}
+
+/**
+ * Look up a cached analysis result for a symbol
+ * @param {Object} symbol - Stock symbol object
+ * @param {string} dateStr - Report date string (yyyy-MM-dd)
+ * @return {Object|null} Cached {summary, metrics, sources} object or null on miss
+ */
+function getCachedAnalysis(symbol, dateStr) {
+  try {
+    var cached = CacheService.getScriptCache().get(buildAnalysisCacheKey(symbol, dateStr));
+    return cached ? JSON.parse(cached) : null;
+  } catch (error) {
+    Logger.log('Error reading analysis cache for ' + symbol.code + ': ' + error.toString());
+    return null;
+  }
+}
+
+/**
+ * Store an analysis result for same-day re-runs
+ * TTL is 6 hours (CacheService maximum) - trading-day analyses go stale quickly
+ * @param {Object} symbol - Stock symbol object
+ * @param {string} dateStr - Report date string (yyyy-MM-dd)
+ * @param {Object} result - Analysis result {summary, metrics, sources}
+ */
+function cacheAnalysis(symbol, dateStr, result) {
+  try {
+    CacheService.getScriptCache().put(buildAnalysisCacheKey(symbol, dateStr), JSON.stringify(result), 21600);
+  } catch (error) {
+    Logger.log('Error writing analysis cache for ' + symbol.code + ': ' + error.toString());
+  }
+}
+
 /**
  * Get previous business day (skips weekends)
  */
@@ -217,15 +320,27 @@ function installTriggers() {
   Logger.log('Trigger installed successfully - will run daily at 06:45 JST on weekdays');
 }
 
+// Handler functions whose triggers this script owns - cleanup must not touch
+// triggers installed by other scripts sharing the project
+var OWNED_TRIGGER_HANDLERS = ['main'];
+
 /**
- * Remove all triggers (for cleanup)
+ * Remove this script's triggers (for cleanup)
+ * Only deletes triggers bound to our own handler functions so triggers
+ * installed by other tooling in the same project survive
  */
 function removeTriggers() {
   var triggers = ScriptApp.getProjectTriggers();
+  var removed = 0;
+
   for (var i = 0; i < triggers.length; i++) {
-    ScriptApp.deleteTrigger(triggers[i]);
+    if (OWNED_TRIGGER_HANDLERS.indexOf(triggers[i].getHandlerFunction()) >= 0) {
+      ScriptApp.deleteTrigger(triggers[i]);
+      removed++;
+    }
   }
-  Logger.log('All triggers removed');
+
+  Logger.log('Removed ' + removed + ' of ' + triggers.length + ' project triggers');
 }
 
 /**
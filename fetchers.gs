@@ -1,43 +1,225 @@
 // ===== fetchers.gs  (night PTS) =====
+
+// Night ranking pages scraped per run - add a type here and the batched
+// fetch, parse and concat in fetchPts() pick it up automatically
+var NIGHT_PTS_TYPES = ['increase', 'decrease'];
+
+// Request headers shared by every kabutan.jp fetch in this file - UrlFetchApp
+// pools connections per host on its own, so the client-side win is building
+// the options object once instead of per call
+var KABUTAN_HEADERS = {
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+  'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+  'Accept-Language': 'ja,en;q=0.8',
+  'Accept-Encoding': 'gzip, deflate, br'
+};
+
+function kabutanRequest(url){
+  return { url:url, headers:KABUTAN_HEADERS, muteHttpExceptions:true };
+}
+
+// Minimum spacing between requests to the same host. Instead of a fixed
+// sleep before every call, each fetch pays only the time remaining since the
+// host was last hit - usually nothing once parsing work fills the gap
+var HOST_THROTTLE = { intervalMs: 500, lastHit: {} };
+
+function throttleHost(url){
+  var m = /^https?:\/\/([^\/]+)/.exec(url);
+  if (!m) return;
+  var host = m[1];
+  var now = Date.now();
+  var waitMs = HOST_THROTTLE.intervalMs - (now - (HOST_THROTTLE.lastHit[host] || 0));
+  if (waitMs > 0) Utilities.sleep(waitMs);
+  HOST_THROTTLE.lastHit[host] = Date.now();
+}
+
+// Parser regexes, compiled once at script scope rather than per parse call
+var TABLE_RE=/<table[^>]*>[\s\S]*?<\/table>/g,
+    ROW_RE=/<tr[^>]*?>[\s\S]*?<\/tr>/g,
+    CELL_RE=/<td[^>]*?>([\s\S]*?)<\/td>/g,
+    TAG_RE=/<[^>]+>/g,
+    CODE_RE=/^\d{3,4}[A-Z]?$/,
+    NUM_CLEAN_RE=/[,，\s]/g; // thousands separators (ASCII and full-width) and stray whitespace
+
+// One cleanup pass per numeric cell with the shared regex above, instead of
+// an inline literal per column
+function parseNum(s){
+  return Number(s.replace(NUM_CLEAN_RE,''));
+}
+
+function nightPtsUrl(type){
+  return 'https://kabutan.jp/warning/pts_night_price_' + type;
+}
+
+// Column layout of the night ranking tables. Both the increase and decrease
+// pages share this shape today; a page with a different layout gets its own
+// spec passed into parseNightPtsTable instead of a forked parser
+var NIGHT_PTS_COLS = { minCells: 7, code: 0, name: 1, close: 4, open: 5 };
+
+// Ranking slots consumed per page - the row loop terminates here rather than
+// scanning the rest of the table
+var NIGHT_PTS_TOP_N = 10;
+
+// Parse results memoized per execution, keyed by a digest of the page body -
+// re-parsing an identical response (retry rounds, repeated fetches within a
+// run) returns the earlier rows without touching the regexes again
+var NIGHT_PTS_PARSE_MEMO = {};
+
+function parseNightPts(html){
+  var digest = Utilities.base64Encode(
+    Utilities.computeDigest(Utilities.DigestAlgorithm.MD5, html, Utilities.Charset.UTF_8));
+  if (NIGHT_PTS_PARSE_MEMO[digest]) return NIGHT_PTS_PARSE_MEMO[digest];
+
+  // Parse table by table instead of matching every <tr> on the page, so row
+  // extraction never touches navigation/ad markup and stops at the first
+  // table that actually yields ranking rows
+  TABLE_RE.lastIndex = 0; // early exits below leave stale exec state
+  var m, data=[];
+  while((m=TABLE_RE.exec(html))!==null){
+    data=parseNightPtsTable(m[0]);
+    if(data.length){ TABLE_RE.lastIndex = 0; break; }
+  }
+  NIGHT_PTS_PARSE_MEMO[digest] = data;
+  return data;
+}
+
+function parseNightPtsTable(tableHtml, cols){
+  cols = cols || NIGHT_PTS_COLS;
+  var data=[];
+  // Walk rows incrementally and stop after NIGHT_PTS_TOP_N slots instead of
+  // materializing every <tr> in the table up front
+  ROW_RE.lastIndex = 0; // loop below breaks early
+  var rm, rowIndex = 0;
+  while((rm=ROW_RE.exec(tableHtml))!==null){
+    if(rowIndex++ === 0) continue;   // header row
+    if(rowIndex > NIGHT_PTS_TOP_N + 1){ ROW_RE.lastIndex = 0; break; } // slots consumed
+    var r=rm[0];
+    var c=(r.match(CELL_RE)||[]).map(function(x){return x.replace(TAG_RE,'').trim();});
+    if(c.length<cols.minCells) continue;
+    var code=c[cols.code], first=code.charCodeAt(0);
+    // Length and leading-digit checks reject most non-code cells before the
+    // regex ever runs (codes are 3-4 digits plus an optional letter)
+    if(code.length<3 || code.length>5 || first<48 || first>57 || !CODE_RE.test(code)) continue;
+    var open = parseNum(c[cols.open]);
+    var close= parseNum(c[cols.close]);
+    var diff = close-open;
+    // Two substring scans over the joined row instead of a callback per cell
+    // (space separator so a marker can never straddle a cell boundary)
+    var rowText = c.join(' ');
+    data.push({
+      code : code,
+      name : c[cols.name].replace(/^東[ＳＧＰＮ]/, ''), // Remove exchange prefix
+      open : open,
+      close: close,
+      diff : diff,
+      pct  : Number((diff/open*100).toFixed(2)),
+      isStopLimit : rowText.indexOf('S高')>=0 || rowText.indexOf('S安')>=0
+    });
+  }
+  return data;
+}
+
 function fetchNightPts(type){
-  var url = 'https://kabutan.jp/warning/pts_night_price_' + type;
-  var opt = { headers:{'User-Agent':'Mozilla/5.0'}, muteHttpExceptions:true };
+  var url = nightPtsUrl(type);
+  var opt = kabutanRequest(url);
   var html, res, retry=0;
   do{
+    throttleHost(url);
     res = UrlFetchApp.fetch(url,opt);
     if(res.getResponseCode()===200){ html=res.getContentText('utf-8'); break; }
     Utilities.sleep(1500);
   }while(++retry<2);
   if(!html) throw new Error('Fetch failed '+url);
+  return parseNightPts(html);
+}
 
-  var rowRe=/<tr[^>]*?>[\s\S]*?<\/tr>/g,
-      cellRe=/<td[^>]*?>([\s\S]*?)<\/td>/g,
-      tag=/<[^>]+>/g, data=[];
-  (html.match(rowRe)||[]).slice(1,11).forEach(function(r){ // TOP10
-    var c=(r.match(cellRe)||[]).map(function(x){return x.replace(tag,'').trim();});
-    if(c.length<7 || !/^\d{3,4}[A-Z]?$/.test(c[0])) return;
-    var open = Number(c[5].replace(/,/g,''));
-    var close= Number(c[4].replace(/,/g,''));
-    var diff = close-open;
-    data.push({
-      code : c[0],
-      name : c[1].replace(/^東[ＳＧＰＮ]/, ''), // Remove exchange prefix
-      open : open,
-      close: close,
-      diff : diff,
-      pct  : Number((diff/open*100).toFixed(2))
-    });
+/**
+ * Fetch every configured night ranking page in one parallel batch
+ * Failed pages are retried together in further batched rounds, so one shared
+ * delay covers all stragglers instead of each page sleeping on its own
+ * @return {Object} Map of ranking type to parsed stock list
+ */
+// Cache TTL for parsed ranking pages. Short enough that a scheduled run
+// always sees fresh data, long enough that back-to-back manual re-runs
+// (debugging, a retried execution) skip the network round-trip
+var NIGHT_PTS_CACHE_TTL_SEC = 600;
+
+function nightPtsCacheKey(type){
+  return 'night_pts_' + type;
+}
+
+function getCachedNightPts(type){
+  try {
+    var cached = CacheService.getScriptCache().get(nightPtsCacheKey(type));
+    return cached ? JSON.parse(cached) : null;
+  } catch (error) {
+    Logger.log('Error reading ranking cache for ' + type + ': ' + error.toString());
+    return null;
+  }
+}
+
+function cacheNightPts(type, rows){
+  try {
+    CacheService.getScriptCache().put(nightPtsCacheKey(type), JSON.stringify(rows), NIGHT_PTS_CACHE_TTL_SEC);
+  } catch (error) {
+    Logger.log('Error writing ranking cache for ' + type + ': ' + error.toString());
+  }
+}
+
+function fetchNightPtsAll(){
+  var byType = {};
+  var pendingTypes = [];
+
+  // Serve recently parsed pages from the script cache before hitting kabutan
+  NIGHT_PTS_TYPES.forEach(function(type){
+    var cached = getCachedNightPts(type);
+    if (cached) {
+      byType[type] = cached;
+      Logger.log('Ranking cache hit for ' + type + ' (' + cached.length + ' symbols)');
+    } else {
+      pendingTypes.push(type);
+    }
   });
-  return data;
+
+  for (var attempt = 0; attempt < 3 && pendingTypes.length > 0; attempt++) {
+    if (attempt > 0) {
+      Logger.log('Retrying ' + pendingTypes.join(', ') + ' (attempt ' + (attempt + 1) + ')');
+      Utilities.sleep(1500);
+    }
+
+    var requests = pendingTypes.map(function(type){
+      return kabutanRequest(nightPtsUrl(type));
+    });
+    throttleHost(requests[0].url); // one batch counts as one hit
+    var responses = UrlFetchApp.fetchAll(requests);
+
+    var stillPending = [];
+    pendingTypes.forEach(function(type, i){
+      if (responses[i].getResponseCode() === 200) {
+        byType[type] = parseNightPts(responses[i].getContentText('utf-8'));
+        cacheNightPts(type, byType[type]);
+        Logger.log('Fetched ' + byType[type].length + ' symbols for ' + type);
+      } else {
+        Logger.log('Fetch failed for ' + type + ' (HTTP ' + responses[i].getResponseCode() + ')');
+        stillPending.push(type);
+      }
+    });
+    pendingTypes = stillPending;
+  }
+
+  if (pendingTypes.length > 0) {
+    throw new Error('Fetch failed ' + pendingTypes.map(nightPtsUrl).join(', '));
+  }
+
+  return byType;
 }
 
-/** entry for main() */
+/** entry for main() - ranking pages fetched in one parallel batch */
 function fetchPts(){
-  var gainers = fetchNightPts('increase');
-  var decliners = fetchNightPts('decrease');
-  
-  Logger.log('Fetched ' + gainers.length + ' gainers, ' + decliners.length + ' decliners');
-  return gainers.concat(decliners);
+  var byType = fetchNightPtsAll();
+  return NIGHT_PTS_TYPES.reduce(function(all, type){
+    return all.concat(byType[type]);
+  }, []);
 }
 
 /**
@@ -94,73 +276,81 @@ function fetchNews(code) {
 function fetchKabutanStockNews(code) {
   try {
     var url = 'https://kabutan.jp/stock/news?code=' + code;
-    var options = {
-      headers: { 'User-Agent': 'Mozilla/5.0' },
-      muteHttpExceptions: true
-    };
-    
+    var options = kabutanRequest(url);
+
+    throttleHost(url);
     var response = UrlFetchApp.fetch(url, options);
     if (response.getResponseCode() !== 200) {
       Logger.log('Failed to fetch Kabutan news for ' + code + ': HTTP ' + response.getResponseCode());
       return [];
     }
     
-    var html = response.getContentText();
-    var articles = [];
-    
+    var html = response.getContentText('utf-8');
+
     // Fixed selector: /stock/news?code=XXXX (no extra slash)
     var titlePattern = new RegExp('<a[^>]*href="([^"]*\\/stock\\/news\\?code=' + code + '[^"]*)"[^>]*>([^<]+)<\\/a>', 'g');
-    
+
     var match;
     var processedUrls = {};
-    
+    var pending = [];
+
+    // Collect up to 5 unique article links first, then fetch them in one batch
     while ((match = titlePattern.exec(html)) !== null) {
       var href = match[1];
       var title = match[2].trim();
-      
+
       // Skip if we've already processed this URL
       if (processedUrls[href]) continue;
       processedUrls[href] = true;
-      
-      // Follow the link to get full article content
+
       var fullUrl = href.startsWith('http') ? href : 'https://kabutan.jp' + href;
-      
+      pending.push({ title: title, url: fullUrl });
+
+      // Limit to prevent timeout
+      if (pending.length >= 5) break;
+    }
+
+    if (pending.length === 0) {
+      return [];
+    }
+
+    // Fetch all article pages concurrently instead of one fetch + sleep per article
+    var requests = pending.map(function(item) {
+      return kabutanRequest(item.url);
+    });
+    throttleHost(requests[0].url); // one batch counts as one hit
+    var responses = UrlFetchApp.fetchAll(requests);
+
+    var articles = [];
+    for (var i = 0; i < responses.length; i++) {
       try {
-        var articleResponse = UrlFetchApp.fetch(fullUrl, options);
-        if (articleResponse.getResponseCode() === 200) {
-          var articleHtml = articleResponse.getContentText();
-          
-          // Extract article content
-          var contentMatch = articleHtml.match(/<div[^>]*class="[^"]*article[^"]*"[^>]*>([\s\S]*?)<\/div>/i);
-          var content = '';
-          if (contentMatch) {
-            content = contentMatch[1]
-              .replace(/<[^>]*>/g, '')
-              .replace(/\s+/g, ' ')
-              .trim()
-              .substring(0, 500);
-          }
-          
-          articles.push({
-            title: title,
-            content: content,
-            url: fullUrl,
-            source: 'Kabutan',
-            date: new Date()
-          });
+        if (responses[i].getResponseCode() !== 200) continue;
+        var articleHtml = responses[i].getContentText('utf-8');
+
+        // Extract article content
+        var contentMatch = articleHtml.match(/<div[^>]*class="[^"]*article[^"]*"[^>]*>([\s\S]*?)<\/div>/i);
+        var content = '';
+        if (contentMatch) {
+          content = contentMatch[1]
+            .replace(/<[^>]*>/g, '')
+            .replace(/\s+/g, ' ')
+            .trim()
+            .substring(0, 500);
         }
-        
-        // Rate limiting
-        Utilities.sleep(300);
-        
+
+        articles.push({
+          title: pending[i].title,
+          content: content,
+          url: pending[i].url,
+          source: 'Kabutan',
+          date: new Date()
+        });
+
       } catch (articleError) {
-        Logger.log('Error fetching article ' + fullUrl + ': ' + articleError.toString());
+        Logger.log('Error parsing article ' + pending[i].url + ': ' + articleError.toString());
       }
-      
-      // Limit to prevent timeout
-      if (articles.length >= 5) break;
     }
-    
+
     return articles;
     
   } catch (error) {
@@ -177,21 +367,17 @@ function fetchKabutanStockNews(code) {
 function getCompanyOverview(code) {
   try {
     var url = 'https://kabutan.jp/stock/?code=' + code;
-    
-    var response = UrlFetchApp.fetch(url, {
-      'method': 'GET',
-      'headers': {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-      }
-    });
+
+    throttleHost(url);
+    var response = UrlFetchApp.fetch(url, kabutanRequest(url));
     
     if (response.getResponseCode() !== 200) {
       Logger.log('Failed to fetch company overview for ' + code + ': HTTP ' + response.getResponseCode());
       return '';
     }
     
-    var html = response.getContentText();
-    
+    var html = response.getContentText('utf-8');
+
     // Look for company overview section
     var overviewPattern = /<th[^>]*>概要<\/th>[\s\S]*?<td[^>]*>(.*?)<\/td>/i;
     var match = overviewPattern.exec(html);
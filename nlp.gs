@@ -1,5 +1,110 @@
 // nlp.gs - Natural language processing functions for embeddings, clustering, and summarization
 
+// OpenAI chat completion settings shared by every summarization call
+var OPENAI_CHAT_URL = 'https://api.openai.com/v1/chat/completions';
+var OPENAI_CHAT_MODEL = 'gpt-4o-mini';
+
+// Reports cite at most this many source URLs per symbol
+var MAX_SOURCE_URLS = 3;
+
+// Round-robin state for OpenAI API keys (keys are loaded once per execution)
+var OPENAI_KEY_STATE = { keys: null, next: 0 };
+
+/**
+ * Build a chat-completion request object for UrlFetchApp
+ * Single place that knows the endpoint, model and auth header shape, so
+ * call sites only supply their messages and sampling settings
+ * @param {Array} messages - Chat messages array
+ * @param {number} temperature - Sampling temperature
+ * @param {number} maxTokens - Maximum completion tokens
+ * @param {string} openAiKey - OpenAI API key
+ * @return {Object} Request object usable with fetch(url, request) or fetchAll
+ */
+function buildChatRequest(messages, temperature, maxTokens, openAiKey) {
+  return {
+    url: OPENAI_CHAT_URL,
+    method: 'POST',
+    headers: {
+      'Authorization': 'Bearer ' + openAiKey,
+      'Content-Type': 'application/json'
+    },
+    payload: JSON.stringify({
+      model: OPENAI_CHAT_MODEL,
+      messages: messages,
+      temperature: temperature,
+      max_tokens: maxTokens
+    }),
+    muteHttpExceptions: true
+  };
+}
+
+/**
+ * Check whether an HTTP status is worth retrying (rate limit or server error)
+ * @param {number} code - HTTP response code
+ * @return {boolean} True when the request should be retried
+ */
+function isRetryableStatus(code) {
+  return code === 429 || code >= 500;
+}
+
+/**
+ * Fetch with exponential backoff on 429/5xx responses
+ * Transient rate-limit and server errors are common for LLM APIs; a failed
+ * first attempt should not poison a whole symbol's summary. Sleeps
+ * min(2^attempt, 30)s plus jitter between attempts and returns the last
+ * response when the budget is exhausted so callers keep their error handling
+ * @param {string} url - Request URL
+ * @param {Object} options - UrlFetchApp options (must mute HTTP exceptions)
+ * @param {number} [maxAttempts] - Attempt budget (default 5)
+ * @return {HTTPResponse} Last response received
+ */
+function fetchWithBackoff(url, options, maxAttempts) {
+  maxAttempts = maxAttempts || 5;
+  var response;
+
+  for (var attempt = 0; attempt < maxAttempts; attempt++) {
+    if (attempt > 0) {
+      var delayMs = Math.min(Math.pow(2, attempt), 30) * 1000 + Math.floor(Math.random() * 1000);
+      Logger.log('Retrying ' + url + ' in ' + delayMs + 'ms (attempt ' + (attempt + 1) + '/' + maxAttempts + ')');
+      Utilities.sleep(delayMs);
+    }
+
+    response = UrlFetchApp.fetch(url, options);
+    if (!isRetryableStatus(response.getResponseCode())) {
+      return response;
+    }
+  }
+
+  return response;
+}
+
+/**
+ * Get the next OpenAI API key in round-robin order
+ * Reads OPENAI_API_KEYS (comma-separated) from Script Properties, falling back
+ * to the single OPENAI_API_KEY, so per-key rate limits can be spread across
+ * several keys without touching the call sites
+ * @return {string|null} API key or null when none configured
+ */
+function getOpenAiKey() {
+  if (OPENAI_KEY_STATE.keys === null) {
+    var props = PropertiesService.getScriptProperties();
+    var raw = props.getProperty('OPENAI_API_KEYS') || props.getProperty('OPENAI_API_KEY') || '';
+    OPENAI_KEY_STATE.keys = raw.split(',').map(function(key) {
+      return key.trim();
+    }).filter(function(key) {
+      return key.length > 0;
+    });
+  }
+
+  if (OPENAI_KEY_STATE.keys.length === 0) {
+    return null;
+  }
+
+  var key = OPENAI_KEY_STATE.keys[OPENAI_KEY_STATE.next % OPENAI_KEY_STATE.keys.length];
+  OPENAI_KEY_STATE.next++;
+  return key;
+}
+
 /**
  * Get OpenAI embeddings for an array of text strings
  * @param {Array} textArray - Array of text strings to embed
@@ -7,7 +112,7 @@
  */
 function getEmbeddings(textArray) {
   try {
-    var openAiKey = PropertiesService.getScriptProperties().getProperty('OPENAI_API_KEY');
+    var openAiKey = getOpenAiKey();
     if (!openAiKey || !openAiKey.startsWith('sk-')) {
       console.error('Invalid or missing OPENAI_API_KEY. Expected format: sk-...');
       Logger.log('Error: OPENAI_API_KEY not found or invalid format in Script Properties');
@@ -27,10 +132,11 @@ function getEmbeddings(textArray) {
         'Authorization': 'Bearer ' + openAiKey,
         'Content-Type': 'application/json'
       },
-      'payload': JSON.stringify(payload)
+      'payload': JSON.stringify(payload),
+      'muteHttpExceptions': true
     };
     
-    var response = UrlFetchApp.fetch(url, options);
+    var response = fetchWithBackoff(url, options);
     
     if (response.getResponseCode() !== 200) {
       throw new Error('OpenAI API returned status: ' + response.getResponseCode());
@@ -139,7 +245,7 @@ function summarizeClustersWithOverview(clusters, companyOverview, symbol) {
       return { summary: '', sources: [], metrics: '' };
     }
     
-    var openAiKey = PropertiesService.getScriptProperties().getProperty('OPENAI_API_KEY');
+    var openAiKey = getOpenAiKey();
     if (!openAiKey || !openAiKey.startsWith('sk-')) {
       console.error('Invalid or missing OPENAI_API_KEY. Expected format: sk-...');
       Logger.log('Error: OPENAI_API_KEY not found or invalid format in Script Properties');
@@ -154,7 +260,9 @@ function summarizeClustersWithOverview(clusters, companyOverview, symbol) {
       var cluster = clusters[i];
       for (var j = 0; j < cluster.length; j++) {
         allArticles.push(cluster[j]);
-        if (cluster[j].url && allSources.indexOf(cluster[j].url) === -1) {
+        // Stop collecting once the citation limit is reached - extra URLs are never output
+        if (allSources.length < MAX_SOURCE_URLS &&
+            cluster[j].url && allSources.indexOf(cluster[j].url) === -1) {
           allSources.push(cluster[j].url);
         }
       }
@@ -164,18 +272,10 @@ function summarizeClustersWithOverview(clusters, companyOverview, symbol) {
     Logger.log('Extracting facts from ' + allArticles.length + ' articles');
     var facts = extractFacts(allArticles);
     
-    // Stage 1: Map - Structure each cluster into JSON
+    // Stage 1: Map - Structure each cluster into JSON (all clusters in one parallel batch)
     Logger.log('Stage 1: Map phase - structuring ' + clusters.length + ' clusters');
-    var structuredClusters = [];
-    
-    for (var k = 0; k < clusters.length; k++) {
-      var structuredCluster = mapToStructureWithOverview(clusters[k], companyOverview, openAiKey);
-      if (structuredCluster && structuredCluster.title) {
-        structuredClusters.push(structuredCluster);
-        Logger.log('Mapped cluster ' + (k + 1) + ': ' + structuredCluster.title);
-      }
-    }
-    
+    var structuredClusters = mapClustersInParallel(clusters, companyOverview, openAiKey);
+
     // Stage 2: Reduce - Aggregate KPIs and merge insights
     Logger.log('Stage 2: Reduce phase - aggregating insights');
     var aggregatedInsights = aggregateKPIs(structuredClusters, facts);
@@ -190,8 +290,8 @@ function summarizeClustersWithOverview(clusters, companyOverview, symbol) {
     // Format metrics as CSV
     var metricsCSV = formatMetricsAsCSV(facts);
     
-    // Limit sources to top 3
-    var topSources = allSources.slice(0, 3);
+    // Already capped at MAX_SOURCE_URLS during collection
+    var topSources = allSources;
     
     Logger.log('3-stage summary with overview completed: ' + cleanSummary.length + ' chars, ' + metricsCSV.length + ' metrics');
     
@@ -218,7 +318,7 @@ function summarizeClusters(clusters) {
       return { summary: '', sources: [], metrics: '' };
     }
     
-    var openAiKey = PropertiesService.getScriptProperties().getProperty('OPENAI_API_KEY');
+    var openAiKey = getOpenAiKey();
     if (!openAiKey || !openAiKey.startsWith('sk-')) {
       console.error('Invalid or missing OPENAI_API_KEY. Expected format: sk-...');
       Logger.log('Error: OPENAI_API_KEY not found or invalid format in Script Properties');
@@ -233,7 +333,9 @@ function summarizeClusters(clusters) {
       var cluster = clusters[i];
       for (var j = 0; j < cluster.length; j++) {
         allArticles.push(cluster[j]);
-        if (cluster[j].url && allSources.indexOf(cluster[j].url) === -1) {
+        // Stop collecting once the citation limit is reached - extra URLs are never output
+        if (allSources.length < MAX_SOURCE_URLS &&
+            cluster[j].url && allSources.indexOf(cluster[j].url) === -1) {
           allSources.push(cluster[j].url);
         }
       }
@@ -243,18 +345,10 @@ function summarizeClusters(clusters) {
     Logger.log('Extracting facts from ' + allArticles.length + ' articles');
     var facts = extractFacts(allArticles);
     
-    // Stage 1: Map - Structure each cluster into JSON
+    // Stage 1: Map - Structure each cluster into JSON (all clusters in one parallel batch)
     Logger.log('Stage 1: Map phase - structuring ' + clusters.length + ' clusters');
-    var structuredClusters = [];
-    
-    for (var k = 0; k < clusters.length; k++) {
-      var structuredCluster = mapToStructure(clusters[k], openAiKey);
-      if (structuredCluster && structuredCluster.title) {
-        structuredClusters.push(structuredCluster);
-        Logger.log('Mapped cluster ' + (k + 1) + ': ' + structuredCluster.title);
-      }
-    }
-    
+    var structuredClusters = mapClustersInParallel(clusters, null, openAiKey);
+
     // Stage 2: Reduce - Aggregate KPIs and merge insights
     Logger.log('Stage 2: Reduce phase - aggregating insights');
     var aggregatedInsights = aggregateKPIs(structuredClusters, facts);
@@ -266,8 +360,8 @@ function summarizeClusters(clusters) {
     // Format metrics as CSV
     var metricsCSV = formatMetricsAsCSV(facts);
     
-    // Limit sources to top 3
-    var topSources = allSources.slice(0, 3);
+    // Already capped at MAX_SOURCE_URLS during collection
+    var topSources = allSources;
     
     Logger.log('3-stage summary completed: ' + narrativeResult.summary.length + ' chars, ' + metricsCSV.length + ' metrics');
     
@@ -284,71 +378,117 @@ function summarizeClusters(clusters) {
 }
 
 /**
- * Stage 1: Map cluster to structured JSON format with company overview
- * @param {Array} cluster - Single cluster of articles
- * @param {string} companyOverview - Company overview text
+ * Stage 1: Map all clusters to structured JSON in one parallel batch
+ * Builds one chat-completion request per cluster and issues them together via
+ * UrlFetchApp.fetchAll(), so wall time is one round-trip instead of one per cluster.
+ * Responses are processed in submission order to keep cluster ordering deterministic.
+ * @param {Array} clusters - Array of article clusters
+ * @param {string|null} companyOverview - Company overview text (null for legacy path)
  * @param {string} openAiKey - OpenAI API key
- * @return {Object} Structured cluster data
+ * @return {Array} Array of structured cluster objects
  */
-function mapToStructureWithOverview(cluster, companyOverview, openAiKey) {
+function mapClustersInParallel(clusters, companyOverview, openAiKey) {
+  var structuredClusters = [];
+
   try {
-    if (!cluster || cluster.length === 0) {
-      return null;
-    }
-    
-    // Prepare cluster text
-    var clusterText = '';
-    for (var i = 0; i < cluster.length; i++) {
-      var article = cluster[i];
-      clusterText += 'Title: ' + (article.title || '') + '\nContent: ' + (article.content || '') + '\n\n';
+    // Build one request per non-empty cluster, remembering its original position
+    var requests = [];
+    var clusterIndexes = [];
+
+    for (var i = 0; i < clusters.length; i++) {
+      var request = buildClusterMapRequest(clusters[i], companyOverview, openAiKey);
+      if (request) {
+        requests.push(request);
+        clusterIndexes.push(i);
+      }
     }
-    
-    // Limit text length for API efficiency
-    if (clusterText.length > 2000) {
-      clusterText = clusterText.substring(0, 2000);
+
+    if (requests.length === 0) {
+      return structuredClusters;
     }
-    
-    // Prepare context with company overview
-    var contextText = companyOverview ? '会社概要: ' + companyOverview + '\n\n' : '';
-    
-    var url = 'https://api.openai.com/v1/chat/completions';
-    
-    var messages = [
-      {
-        role: 'system',
-        content: 'ニュースクラスターを会社概要を踏まえて構造化JSONに変換してください。出力形式：{"title":"要因名","kpi":"数値指標","driver":"主要要因","outlook":"将来見通し"}'
-      },
-      {
-        role: 'user',
-        content: contextText + '以下のニュースクラスターを構造化JSONに変換してください：\n\n' + clusterText
+
+    // Fire all cluster requests concurrently
+    var responses = UrlFetchApp.fetchAll(requests);
+
+    for (var j = 0; j < responses.length; j++) {
+      var response = responses[j];
+      if (isRetryableStatus(response.getResponseCode())) {
+        response = fetchWithBackoff(requests[j].url, requests[j], 3);
       }
-    ];
-    
-    var payload = {
-      model: 'gpt-4o-mini',
-      messages: messages,
-      temperature: 0.1,
-      max_tokens: 200
-    };
-    
-    var options = {
-      method: 'POST',
-      headers: {
-        'Authorization': 'Bearer ' + openAiKey,
-        'Content-Type': 'application/json'
-      },
-      payload: JSON.stringify(payload)
-    };
-    
-    var response = UrlFetchApp.fetch(url, options);
-    
+      var structuredCluster = parseClusterMapResponse(response);
+      if (structuredCluster && structuredCluster.title) {
+        structuredClusters.push(structuredCluster);
+        Logger.log('Mapped cluster ' + (clusterIndexes[j] + 1) + ': ' + structuredCluster.title);
+      }
+    }
+
+    return structuredClusters;
+
+  } catch (error) {
+    Logger.log('Error in mapClustersInParallel(): ' + error.toString());
+    return structuredClusters;
+  }
+}
+
+/**
+ * Build a UrlFetchApp request object for mapping one cluster to structured JSON
+ * @param {Array} cluster - Single cluster of articles
+ * @param {string|null} companyOverview - Company overview text (null to omit)
+ * @param {string} openAiKey - OpenAI API key
+ * @return {Object|null} Request object for UrlFetchApp.fetchAll, or null for empty clusters
+ */
+function buildClusterMapRequest(cluster, companyOverview, openAiKey) {
+  if (!cluster || cluster.length === 0) {
+    return null;
+  }
+
+  // Prepare cluster text
+  var clusterText = '';
+  for (var i = 0; i < cluster.length; i++) {
+    var article = cluster[i];
+    clusterText += 'Title: ' + (article.title || '') + '\nContent: ' + (article.content || '') + '\n\n';
+  }
+
+  // Limit text length for API efficiency
+  var maxLength = companyOverview ? 2000 : 2500;
+  if (clusterText.length > maxLength) {
+    clusterText = clusterText.substring(0, maxLength);
+  }
+
+  // Prepare context with company overview when available
+  var contextText = companyOverview ? '会社概要: ' + companyOverview + '\n\n' : '';
+  var systemPrompt = companyOverview
+    ? 'ニュースクラスターを会社概要を踏まえて構造化JSONに変換してください。出力形式：{"title":"要因名","kpi":"数値指標","driver":"主要要因","outlook":"将来見通し"}'
+    : 'ニュースクラスターを構造化JSONに変換してください。出力形式：{"title":"要因名","kpi":"数値指標","driver":"主要要因","outlook":"将来見通し"}';
+
+  var messages = [
+    {
+      role: 'system',
+      content: systemPrompt
+    },
+    {
+      role: 'user',
+      content: contextText + '以下のニュースクラスターを構造化JSONに変換してください：\n\n' + clusterText
+    }
+  ];
+
+  return buildChatRequest(messages, 0.1, 200, openAiKey);
+}
+
+/**
+ * Parse a single cluster-map HTTP response into a structured cluster object
+ * @param {HTTPResponse} response - Response from UrlFetchApp
+ * @return {Object|null} Structured cluster data or null on error
+ */
+function parseClusterMapResponse(response) {
+  try {
     if (response.getResponseCode() !== 200) {
       throw new Error('OpenAI API returned status: ' + response.getResponseCode());
     }
-    
+
     var data = JSON.parse(response.getContentText());
     var jsonText = data.choices[0].message.content || '';
-    
+
     // Try to parse the JSON response
     try {
       return JSON.parse(jsonText);
@@ -361,7 +501,30 @@ function mapToStructureWithOverview(cluster, companyOverview, openAiKey) {
         outlook: ''
       };
     }
-    
+
+  } catch (error) {
+    Logger.log('Error in parseClusterMapResponse(): ' + error.toString());
+    return null;
+  }
+}
+
+/**
+ * Stage 1: Map cluster to structured JSON format with company overview
+ * @param {Array} cluster - Single cluster of articles
+ * @param {string} companyOverview - Company overview text
+ * @param {string} openAiKey - OpenAI API key
+ * @return {Object} Structured cluster data
+ */
+function mapToStructureWithOverview(cluster, companyOverview, openAiKey) {
+  try {
+    var request = buildClusterMapRequest(cluster, companyOverview, openAiKey);
+    if (!request) {
+      return null;
+    }
+
+    var response = fetchWithBackoff(request.url, request);
+    return parseClusterMapResponse(response);
+
   } catch (error) {
     Logger.log('Error in mapToStructureWithOverview(): ' + error.toString());
     return null;
@@ -376,73 +539,14 @@ function mapToStructureWithOverview(cluster, companyOverview, openAiKey) {
  */
 function mapToStructure(cluster, openAiKey) {
   try {
-    if (!cluster || cluster.length === 0) {
+    var request = buildClusterMapRequest(cluster, null, openAiKey);
+    if (!request) {
       return null;
     }
-    
-    // Prepare cluster text
-    var clusterText = '';
-    for (var i = 0; i < cluster.length; i++) {
-      var article = cluster[i];
-      clusterText += 'Title: ' + (article.title || '') + '\nContent: ' + (article.content || '') + '\n\n';
-    }
-    
-    // Limit text length for API efficiency
-    if (clusterText.length > 2500) {
-      clusterText = clusterText.substring(0, 2500);
-    }
-    
-    var url = 'https://api.openai.com/v1/chat/completions';
-    
-    var messages = [
-      {
-        role: 'system',
-        content: 'ニュースクラスターを構造化JSONに変換してください。出力形式：{"title":"要因名","kpi":"数値指標","driver":"主要要因","outlook":"将来見通し"}'
-      },
-      {
-        role: 'user',
-        content: '以下のニュースクラスターを構造化JSONに変換してください：\n\n' + clusterText
-      }
-    ];
-    
-    var payload = {
-      model: 'gpt-4o-mini',
-      messages: messages,
-      temperature: 0.1,
-      max_tokens: 200
-    };
-    
-    var options = {
-      method: 'POST',
-      headers: {
-        'Authorization': 'Bearer ' + openAiKey,
-        'Content-Type': 'application/json'
-      },
-      payload: JSON.stringify(payload)
-    };
-    
-    var response = UrlFetchApp.fetch(url, options);
-    
-    if (response.getResponseCode() !== 200) {
-      throw new Error('OpenAI API returned status: ' + response.getResponseCode());
-    }
-    
-    var data = JSON.parse(response.getContentText());
-    var jsonText = data.choices[0].message.content || '';
-    
-    // Try to parse the JSON response
-    try {
-      return JSON.parse(jsonText);
-    } catch (parseError) {
-      Logger.log('Failed to parse structured response: ' + jsonText);
-      return {
-        title: '情報不足',
-        kpi: '',
-        driver: '詳細情報の不足により要因特定困難',
-        outlook: ''
-      };
-    }
-    
+
+    var response = fetchWithBackoff(request.url, request);
+    return parseClusterMapResponse(response);
+
   } catch (error) {
     Logger.log('Error in mapToStructure(): ' + error.toString());
     return null;
@@ -577,8 +681,6 @@ function generateNarrativeWithOverview(insights, companyOverview, openAiKey) {
     var contextText = insights.industryContext;
     var overviewText = companyOverview || '会社概要情報なし';
     
-    var url = 'https://api.openai.com/v1/chat/completions';
-    
     var messages = [
       {
         role: 'system',
@@ -590,23 +692,8 @@ function generateNarrativeWithOverview(insights, companyOverview, openAiKey) {
       }
     ];
     
-    var payload = {
-      model: 'gpt-4o-mini',
-      messages: messages,
-      temperature: 0.2,
-      max_tokens: 200
-    };
-    
-    var options = {
-      method: 'POST',
-      headers: {
-        'Authorization': 'Bearer ' + openAiKey,
-        'Content-Type': 'application/json'
-      },
-      payload: JSON.stringify(payload)
-    };
-    
-    var response = UrlFetchApp.fetch(url, options);
+    var request = buildChatRequest(messages, 0.2, 200, openAiKey);
+    var response = fetchWithBackoff(request.url, request);
     
     if (response.getResponseCode() !== 200) {
       throw new Error('OpenAI API returned status: ' + response.getResponseCode());
@@ -676,8 +763,6 @@ function generateNarrative(insights, openAiKey) {
     var outlookText = insights.outlookStatements.length > 0 ? insights.outlookStatements[0] : '将来見通し未詳';
     var contextText = insights.industryContext;
     
-    var url = 'https://api.openai.com/v1/chat/completions';
-    
     var messages = [
       {
         role: 'system',
@@ -689,23 +774,8 @@ function generateNarrative(insights, openAiKey) {
       }
     ];
     
-    var payload = {
-      model: 'gpt-4o-mini',
-      messages: messages,
-      temperature: 0.2,
-      max_tokens: 200
-    };
-    
-    var options = {
-      method: 'POST',
-      headers: {
-        'Authorization': 'Bearer ' + openAiKey,
-        'Content-Type': 'application/json'
-      },
-      payload: JSON.stringify(payload)
-    };
-    
-    var response = UrlFetchApp.fetch(url, options);
+    var request = buildChatRequest(messages, 0.2, 200, openAiKey);
+    var response = fetchWithBackoff(request.url, request);
     
     if (response.getResponseCode() !== 200) {
       throw new Error('OpenAI API returned status: ' + response.getResponseCode());
@@ -862,6 +932,30 @@ function enforceFormatRequirements(summary) {
   return finalSummary;
 }
 
+// Fact-extraction patterns, built once at script scope rather than per extractFacts() call
+var SALES_PATTERNS = [
+  /売上高?(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
+  /営業収益(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
+  /売上(?:は|が|：|:)?([0-9,]+)億円/g
+];
+
+var PROFIT_PATTERNS = [
+  /(?:営業|経常|純)?利益(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
+  /(?:営業|経常|純)?損失(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g
+];
+
+var YOY_PATTERNS = [
+  /前年(?:同期)?比([0-9.]+)%(?:増|減|成長|下落)/g,
+  /前年度比([0-9.]+)%(?:増|減|成長|下落)/g,
+  /(?:増収|減収|増益|減益)([0-9.]+)%/g
+];
+
+var OUTLOOK_PATTERNS = [
+  /(?:今期|来期|次期|今年度|来年度)(?:は|の)?(?:予想|見通し|目標)(?:は|が|：|:)?([^。]+)/g,
+  /(?:通期|今期)(?:見通し|予想)(?:は|を)?([^。]+)/g,
+  /業績予想(?:を)?([^。]+)/g
+];
+
 /**
  * Extract financial facts and KPIs from article text using regex patterns
  * @param {Array} articles - Array of article objects
@@ -882,13 +976,7 @@ function extractFacts(articles) {
       var text = (article.title || '') + ' ' + (article.content || '');
       
       // Extract sales figures (億円、百万円、千万円)
-      var salesPatterns = [
-        /売上高?(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
-        /営業収益(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
-        /売上(?:は|が|：|:)?([0-9,]+)億円/g
-      ];
-      
-      salesPatterns.forEach(function(pattern) {
+      SALES_PATTERNS.forEach(function(pattern) {
         var match;
         while ((match = pattern.exec(text)) !== null) {
           facts.sales.push({
@@ -900,12 +988,7 @@ function extractFacts(articles) {
       });
       
       // Extract profit figures
-      var profitPatterns = [
-        /(?:営業|経常|純)?利益(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g,
-        /(?:営業|経常|純)?損失(?:は|が|：|:)?(?:約|おおむね)?([0-9,]+)(?:億|百万|千万)?円/g
-      ];
-      
-      profitPatterns.forEach(function(pattern) {
+      PROFIT_PATTERNS.forEach(function(pattern) {
         var match;
         while ((match = pattern.exec(text)) !== null) {
           var isLoss = match[0].indexOf('損失') >= 0;
@@ -919,13 +1002,7 @@ function extractFacts(articles) {
       });
       
       // Extract YoY growth percentages
-      var yoyPatterns = [
-        /前年(?:同期)?比([0-9.]+)%(?:増|減|成長|下落)/g,
-        /前年度比([0-9.]+)%(?:増|減|成長|下落)/g,
-        /(?:増収|減収|増益|減益)([0-9.]+)%/g
-      ];
-      
-      yoyPatterns.forEach(function(pattern) {
+      YOY_PATTERNS.forEach(function(pattern) {
         var match;
         while ((match = pattern.exec(text)) !== null) {
           var isDecrease = match[0].indexOf('減') >= 0 || match[0].indexOf('下落') >= 0;
@@ -938,13 +1015,7 @@ function extractFacts(articles) {
       });
       
       // Extract outlook/target statements
-      var outlookPatterns = [
-        /(?:今期|来期|次期|今年度|来年度)(?:は|の)?(?:予想|見通し|目標)(?:は|が|：|:)?([^。]+)/g,
-        /(?:通期|今期)(?:見通し|予想)(?:は|を)?([^。]+)/g,
-        /業績予想(?:を)?([^。]+)/g
-      ];
-      
-      outlookPatterns.forEach(function(pattern) {
+      OUTLOOK_PATTERNS.forEach(function(pattern) {
         var match;
         while ((match = pattern.exec(text)) !== null) {
           facts.outlook.push({
@@ -1,4 +1,20 @@
 // ===== writer.gs  mapping part =====
+
+// Column widths for the report layout (A-I), applied once when the worksheet
+// is created rather than on every report run
+var REPORT_COLUMN_WIDTHS = [80, 150, 80, 80, 80, 100, 300, 150, 200];
+
+// Verbose row dumps are opt-in: routine runs skip the JSON.stringify cost
+// entirely unless the DEBUG_LOGGING script property is set to 'true'
+var DEBUG_LOGGING = null; // resolved on first use
+
+function isDebugLogging() {
+  if (DEBUG_LOGGING === null) {
+    DEBUG_LOGGING = PropertiesService.getScriptProperties().getProperty('DEBUG_LOGGING') === 'true';
+  }
+  return DEBUG_LOGGING;
+}
+
 /**
  * Update spreadsheet with PTS data
  * @param {Array} allRows - Array of stock data rows
@@ -6,7 +22,7 @@
 function updateSheet(allRows) {
   try {
     var spreadsheet = getOrCreateSpreadsheet();
-    var sheet = getOrCreateWorksheet(spreadsheet, 'PTS Daily Report');
+    var sheet = getOrCreateWorksheet(spreadsheet, 'PTS Daily Report', REPORT_COLUMN_WIDTHS);
     
     // Set headers (A-I columns)
     var headers = [
@@ -25,17 +41,20 @@ function updateSheet(allRows) {
     if (sheet.getLastRow() > 2) {
       sheet.getRange(3, 1, sheet.getLastRow() - 2, 9).clear();
     }
-    
-    // Set headers
-    sheet.getRange(2, 1, 1, headers.length).setValues([headers]);
-    
+
+    // Assemble headers and data rows into one block so the sheet is written
+    // with a single setValues call instead of one write per section
+    var values = [headers];
+
     if (allRows && allRows.length > 0) {
-      Logger.log('DEBUG: Writing ' + allRows.length + ' rows to spreadsheet');
-      Logger.log('DEBUG: First row data: ' + JSON.stringify(allRows[0]));
-      
+      if (isDebugLogging()) {
+        Logger.log('DEBUG: Writing ' + allRows.length + ' rows to spreadsheet');
+        Logger.log('DEBUG: First row data: ' + JSON.stringify(allRows[0]));
+      }
+
       // Map data to match A-I column structure
-      var values = allRows.map(function(row) {
-        return [
+      allRows.forEach(function(row) {
+        values.push([
           row.code || '',                           // A: コード
           row.name || '',                           // B: 銘柄名
           row.open || 0,                           // C: 始値 (previous close)
@@ -45,76 +64,99 @@ function updateSheet(allRows) {
           row.summary || '',                       // G: AI要約
           row.metrics || '',                       // H: メトリクス
           (row.sources || []).slice(0, 3).join('\n')  // I: 情報源 (最大3つ)
-        ];
+        ]);
       });
-      
-      Logger.log('DEBUG: Mapped values length: ' + values.length);
-      Logger.log('DEBUG: First mapped row: ' + JSON.stringify(values[0]));
-      
-      // Write data to sheet
-      sheet.getRange(3, 1, values.length, 9).setValues(values);
-      
+    }
+
+    // Write headers and data to sheet in one shot (starting at header row 2)
+    sheet.getRange(2, 1, values.length, 9).setValues(values);
+
+    if (allRows && allRows.length > 0) {
       // Format percentage column
-      sheet.getRange(3, 6, values.length, 1).setNumberFormat('0.00%');
-      
-      Logger.log('Successfully updated sheet with ' + values.length + ' rows');
+      sheet.getRange(3, 6, allRows.length, 1).setNumberFormat('0.00%');
+
+      Logger.log('Successfully updated sheet with ' + allRows.length + ' rows');
     }
     
-    // Set column widths for better display
-    sheet.setColumnWidth(1, 80);   // Code
-    sheet.setColumnWidth(2, 150);  // Name
-    sheet.setColumnWidth(3, 80);   // Open
-    sheet.setColumnWidth(4, 80);   // Close
-    sheet.setColumnWidth(5, 80);   // Diff
-    sheet.setColumnWidth(6, 100);  // Percent
-    sheet.setColumnWidth(7, 300);  // Summary
-    sheet.setColumnWidth(8, 150);  // Metrics
-    sheet.setColumnWidth(9, 200);  // Sources
-    
   } catch (error) {
     Logger.log('Error in updateSheet(): ' + error.toString());
     throw error;
   }
 }
 
+/**
+ * Apply column widths, coalescing runs of equal widths into one call each
+ * Adjacent columns sharing a width (e.g. the price columns) are set with a
+ * single setColumnWidths range instead of one API call per column
+ * @param {Sheet} sheet - Google Sheet object
+ * @param {Array} widths - Width in pixels for each column, starting at column 1
+ */
+function applyColumnWidths(sheet, widths) {
+  var start = 0;
+  while (start < widths.length) {
+    var end = start + 1;
+    while (end < widths.length && widths[end] === widths[start]) {
+      end++;
+    }
+    sheet.setColumnWidths(start + 1, end - start, widths[start]);
+    start = end;
+  }
+}
+
+// Spreadsheet handle resolved once per execution - repeated callers skip the
+// Script Properties read and the openById round-trip
+var SPREADSHEET_CACHE = { spreadsheet: null };
+
 /**
  * Get or create main spreadsheet
  * @return {Spreadsheet} Google Spreadsheet object
  */
 function getOrCreateSpreadsheet() {
+  if (SPREADSHEET_CACHE.spreadsheet) {
+    return SPREADSHEET_CACHE.spreadsheet;
+  }
+
   var spreadsheetId = PropertiesService.getScriptProperties().getProperty('SPREADSHEET_ID');
-  
+
   if (spreadsheetId) {
     try {
-      return SpreadsheetApp.openById(spreadsheetId);
+      SPREADSHEET_CACHE.spreadsheet = SpreadsheetApp.openById(spreadsheetId);
+      return SPREADSHEET_CACHE.spreadsheet;
     } catch (error) {
       Logger.log('Spreadsheet not found with ID: ' + spreadsheetId + ', creating new one');
     }
   }
-  
+
   // Create new spreadsheet
   var spreadsheet = SpreadsheetApp.create('PTS Daily Report - ' + Utilities.formatDate(new Date(), 'Asia/Tokyo', 'yyyy-MM-dd'));
   var newId = spreadsheet.getId();
-  
+
   PropertiesService.getScriptProperties().setProperty('SPREADSHEET_ID', newId);
   Logger.log('Created new spreadsheet with ID: ' + newId);
-  
+
+  SPREADSHEET_CACHE.spreadsheet = spreadsheet;
   return spreadsheet;
 }
 
 /**
  * Get or create worksheet
+ * Column widths are a one-shot setup cost: they are applied only when the
+ * worksheet is first created, not re-applied on every report write
  * @param {Spreadsheet} spreadsheet - Google Spreadsheet object
  * @param {string} sheetName - Name of the worksheet
+ * @param {Array} [columnWidths] - Widths applied once on creation
  * @return {Sheet} Google Sheet object
  */
-function getOrCreateWorksheet(spreadsheet, sheetName) {
+function getOrCreateWorksheet(spreadsheet, sheetName, columnWidths) {
   var sheet = spreadsheet.getSheetByName(sheetName);
-  
+
   if (!sheet) {
     sheet = spreadsheet.insertSheet(sheetName);
+    if (columnWidths) {
+      applyColumnWidths(sheet, columnWidths);
+    }
     Logger.log('Created new worksheet: ' + sheetName);
   }
-  
+
   return sheet;
 }
\ No newline at end of file